@@ -1,24 +1,177 @@
 import sys
 import os
 import tempfile
-from urllib.parse import unquote
+from urllib.parse import urlparse
+from urllib.request import url2pathname
 from PyQt5 import QtWidgets, QtCore, QtGui
 import fitz  # PyMuPDF
-from pikepdf import Pdf, Array
+
+BAND_HEIGHT = 512  # Rows per rasterization band of a page render
+# Upper bounds for a page render in device pixels, whatever the zoom and screen;
+# a full RGB page at the pixel limit is already ~75 MB of samples
+MAX_RENDER_WIDTH = 4096
+MAX_RENDER_PIXELS = 4096 * 6144
+
+# MuPDF isn't thread-safe, so render threads share the app's open document and
+# every fitz call that can overlap with a RenderTask holds this lock
+MUPDF_LOCK = QtCore.QMutex()
+
+def page_mediabox(doc, xref):
+    # MediaBox in PDF coordinates, read from the page object; it's inheritable,
+    # so walk up the page tree until one is found
+    while True:
+        kind, value = doc.xref_get_key(xref, "MediaBox")
+        if kind == "xref":
+            kind, value = "array", doc.xref_object(int(value.split()[0]), compressed=True)
+        if kind == "array":
+            return [float(v) for v in value.strip("[]").split()]
+        kind, value = doc.xref_get_key(xref, "Parent")
+        if kind != "xref":
+            return [0.0, 0.0, 612.0, 792.0]  # Spec default, US Letter
+        xref = int(value.split()[0])
+
+
+class RenderSignals(QtCore.QObject):
+    started = QtCore.pyqtSignal(object, int, int, int)  # cache key, width, height, stride
+    band_ready = QtCore.pyqtSignal(object, int, object)  # cache key, first row, samples
+    finished = QtCore.pyqtSignal(object)  # cache key
+
+
+class RenderTask(QtCore.QRunnable):
+    def __init__(self, doc, key, start_fraction=0.0):
+        super().__init__()
+        self.doc = doc
+        self.key = key  # (doc serial, page_num, target width in device pixels, grayscale)
+        self.start_fraction = start_fraction  # How far down the page to start rendering
+        self.signals = RenderSignals()
+        self.cancelled = False  # Set from the GUI thread, checked under MUPDF_LOCK
+        self.buffer = None  # Page samples assembled on the GUI thread
+        self.rows = []  # (first, last) row ranges of buffer filled in so far
+
+    def run(self):
+        _, page_num, target_width, grayscale = self.key
+        with QtCore.QMutexLocker(MUPDF_LOCK):
+            if self.cancelled:
+                return  # The document may already be closed
+            page = self.doc.load_page(page_num)
+            # Rasterize straight to the displayed size; Qt never has to downscale
+            scale = target_width / page.rect.width
+            # Unusually tall pages would still blow past the pixel budget at that width
+            scale = min(scale, (MAX_RENDER_PIXELS / (page.rect.width * page.rect.height)) ** 0.5)
+            matrix = fitz.Matrix(scale, scale)
+            colorspace = fitz.csGRAY if grayscale else fitz.csRGB
+            bbox = (page.rect * matrix).irect
+            page_rect = page.rect
+            # Interpret the page once, then rasterize it in full-width bands so part
+            # of it shows up early and MuPDF never holds a whole high-zoom page at once
+            dlist = page.get_displaylist()
+        self.signals.started.emit(self.key, bbox.width, bbox.height, bbox.width * colorspace.n)
+
+        # Start with the band at the scroll position, then wrap around to the top
+        tops = list(range(0, bbox.height, BAND_HEIGHT))
+        first = min(len(tops) - 1, int(self.start_fraction * bbox.height) // BAND_HEIGHT)
+        for top in tops[first:] + tops[:first]:
+            # Locked per band, so the GUI thread can get at the document in between
+            with QtCore.QMutexLocker(MUPDF_LOCK):
+                if self.cancelled:
+                    break
+                clip = fitz.Rect(page_rect.x0, page_rect.y0 + top / scale,
+                                 page_rect.x1, page_rect.y0 + (top + BAND_HEIGHT) / scale)
+                pix = dlist.get_pixmap(matrix=matrix, colorspace=colorspace, alpha=False, clip=clip)
+                band_top, samples = pix.y - bbox.y0, pix.samples
+                pix = None
+            self.signals.band_ready.emit(self.key, band_top, samples)
+
+        with QtCore.QMutexLocker(MUPDF_LOCK):
+            page = dlist = None
+            # Drop MuPDF's cached fonts/images so scrolling a large scan stays bounded
+            fitz.TOOLS.store_shrink(100)
+        self.signals.finished.emit(self.key)
+
+
+class PagePreviewLabel(QtWidgets.QLabel):
+    # Paints the page pixmap and the translucent cut bands itself, so moving a
+    # band only repaints the widget and never touches an image buffer
+    CUT_BRUSH = QtGui.QBrush(QtGui.QColor(255, 255, 204, 180))
+
+    def __init__(self, text="", parent=None):
+        super().__init__(text, parent)
+        self.bg_pixmap = None
+        self.top_px = 0
+        self.bottom_px = 0
+
+    def set_page_pixmap(self, pixmap):
+        self.bg_pixmap = pixmap
+        self.clear()
+        self.updateGeometry()
+        self.update()
+
+    def set_cuts(self, top_px, bottom_px):
+        # Small spinbox steps often round to the same rows; nothing to repaint then
+        if (top_px, bottom_px) == (self.top_px, self.bottom_px):
+            return
+        self.top_px = top_px
+        self.bottom_px = bottom_px
+        self.update()
+
+    def page_size(self):
+        # Logical size of the page pixmap, which is rendered in device pixels
+        return self.bg_pixmap.size() / self.bg_pixmap.devicePixelRatio()
+
+    def sizeHint(self):
+        if self.bg_pixmap is None:
+            return super().sizeHint()
+        margin = 2 * self.frameWidth()
+        return self.page_size() + QtCore.QSize(margin, margin)
+
+    def minimumSizeHint(self):
+        if self.bg_pixmap is None:
+            return super().minimumSizeHint()
+        return self.sizeHint()
+
+    def paintEvent(self, event):
+        super().paintEvent(event)  # Frame, plus the text while no page is shown
+        if self.bg_pixmap is None or self.text():
+            return
+
+        rect = QtWidgets.QStyle.alignedRect(QtCore.Qt.LeftToRight, self.alignment(),
+                                            self.page_size(), self.contentsRect())
+        painter = QtGui.QPainter(self)
+        painter.drawPixmap(rect.topLeft(), self.bg_pixmap)
+        if self.top_px > 0:
+            painter.fillRect(rect.x(), rect.y(), rect.width(), self.top_px, self.CUT_BRUSH)
+        if self.bottom_px > 0:
+            painter.fillRect(rect.x(), rect.y() + rect.height() - self.bottom_px,
+                             rect.width(), self.bottom_px, self.CUT_BRUSH)
+
 
 class PagePreviewWidget(QtWidgets.QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.doc = None
+        self.doc_serial = None  # Identifies doc in cache keys; ids of closed docs get reused
         self.page_num = None
-        self.original_qimage = None
-        self.zoom_factor = 1.0  # Default zoom (100%)
+        self.selected_pages = []  # Neighbours outside this range aren't prefetched
+        self.bg_pixmap = None
+        # Rendered pages live in the global QPixmapCache under these keys:
+        # (doc serial, page_num, target width in device pixels, grayscale)
+        self._cached_keys = set()  # Keys inserted since the last clear_cache()
+        self._inflight = {}  # Cache key: RenderTask currently running in the pool
+        self._shown_key = None  # Cache key of the image in bg_pixmap
+        self.zoom_factor = 1.0  # Default zoom (1.0 fits the page to the viewport width)
+        # MuPDF's global context isn't thread-safe even across separate documents,
+        # so renders run one at a time. A private pool also keeps them off the
+        # global one, which Qt itself uses (and waits on) for image conversions.
+        self._render_pool = QtCore.QThreadPool(self)
+        self._render_pool.setMaxThreadCount(1)
+        self.grayscale = False  # Render 1 byte/pixel; toggled by the user per document
 
         self.scroll_area = QtWidgets.QScrollArea()
         self.scroll_area.setWidgetResizable(True)
         self.scroll_area.setStyleSheet("background-color: #f0f0f0;")
+        self.scroll_area.installEventFilter(self)
 
-        self.image_label = QtWidgets.QLabel("No page selected")
+        self.image_label = PagePreviewLabel("No page selected")
         self.image_label.setAlignment(QtCore.Qt.AlignCenter)
         self.image_label.setFrameShape(QtWidgets.QFrame.Box)
         self.image_label.setLineWidth(1)
@@ -27,21 +180,31 @@ class PagePreviewWidget(QtWidgets.QWidget):
 
         self.scroll_area.setWidget(self.image_label)
 
+        # Spinboxes emit valueChanged per keystroke/arrow step; coalesce bursts
+        # so only the last value of a drag triggers the actual work
+        self._preview_timer = QtCore.QTimer(self, singleShot=True, interval=100)
+        self._preview_timer.timeout.connect(self.update_preview)
+        self._zoom_timer = QtCore.QTimer(self, singleShot=True, interval=100)
+        self._zoom_timer.timeout.connect(self.reload_page_with_zoom)
+
         self.top_cut_spin = QtWidgets.QDoubleSpinBox()
         self.top_cut_spin.setRange(0, 99.9)
         self.top_cut_spin.setSingleStep(1)
-        self.top_cut_spin.valueChanged.connect(self.update_preview)
+        self.top_cut_spin.valueChanged.connect(lambda _: self._preview_timer.start())
 
         self.bottom_cut_spin = QtWidgets.QDoubleSpinBox()
         self.bottom_cut_spin.setRange(0, 99.9)
         self.bottom_cut_spin.setSingleStep(1)
-        self.bottom_cut_spin.valueChanged.connect(self.update_preview)
+        self.bottom_cut_spin.valueChanged.connect(lambda _: self._preview_timer.start())
 
         self.zoom_spin = QtWidgets.QDoubleSpinBox()
         self.zoom_spin.setRange(0.1, 5.0)
         self.zoom_spin.setSingleStep(0.1)
         self.zoom_spin.setValue(1.0)
-        self.zoom_spin.valueChanged.connect(self.reload_page_with_zoom)
+        self.zoom_spin.valueChanged.connect(lambda _: self._zoom_timer.start())
+
+        self.grayscale_check = QtWidgets.QCheckBox("Grayscale")
+        self.grayscale_check.toggled.connect(self.set_grayscale)
 
         controls_layout = QtWidgets.QHBoxLayout()
         controls_layout.addWidget(QtWidgets.QLabel("Top cut (%):"))
@@ -50,14 +213,26 @@ class PagePreviewWidget(QtWidgets.QWidget):
         controls_layout.addWidget(self.bottom_cut_spin)
         controls_layout.addWidget(QtWidgets.QLabel("Zoom:"))
         controls_layout.addWidget(self.zoom_spin)
+        controls_layout.addWidget(self.grayscale_check)
 
         layout = QtWidgets.QVBoxLayout(self)
         layout.addWidget(self.scroll_area, stretch=1)
         layout.addLayout(controls_layout)
         self.setLayout(layout)
 
-    def load_page(self, doc, page_num, top_cut=0, bottom_cut=0):
+    def eventFilter(self, obj, event):
+        # Pages are rendered at the viewport's width, so re-render (debounced) when it changes
+        if obj is self.scroll_area and event.type() == QtCore.QEvent.Resize:
+            self._zoom_timer.start()
+        return super().eventFilter(obj, event)
+
+    def load_page(self, doc, doc_serial, page_num, top_cut=0, bottom_cut=0):
+        if doc_serial != self.doc_serial:
+            self.clear_cache()
+            self.grayscale = False
+            self._set_grayscale_check(False)
         self.doc = doc
+        self.doc_serial = doc_serial
         self.page_num = page_num
         self.top_cut_spin.setValue(top_cut)
         self.bottom_cut_spin.setValue(bottom_cut)
@@ -68,49 +243,220 @@ class PagePreviewWidget(QtWidgets.QWidget):
             self.zoom_factor = self.zoom_spin.value()
             self.render_page()
 
+    def set_grayscale(self, checked):
+        self.grayscale = checked
+        if self.doc is not None and self.page_num is not None:
+            self.render_page()
+
+    def _set_grayscale_check(self, checked):
+        self.grayscale_check.blockSignals(True)
+        self.grayscale_check.setChecked(checked)
+        self.grayscale_check.blockSignals(False)
+
+    def clear_cache(self):
+        # Only this widget's entries; Qt's styles share the global cache
+        for key in self._cached_keys:
+            QtGui.QPixmapCache.remove(f"page{key}")
+        self._cached_keys.clear()
+        for task in self._inflight.values():
+            task.cancelled = True
+        self._inflight.clear()
+
+    def unload(self):
+        # Forget the document (e.g. before it's closed) so nothing renders from it
+        self.doc = None
+        self.doc_serial = None
+        self.page_num = None
+        self.clear_cache()
+        # Nothing from the old document may be painted over or shown any more
+        self._shown_key = None
+        self.bg_pixmap = None
+        self.image_label.set_page_pixmap(None)
+        self.image_label.setText("No page selected")
+
+    def _target_width(self):
+        # Measured from the scroll area rather than its viewport, so the vertical
+        # scrollbar showing up doesn't change the width and trigger another render
+        area = self.scroll_area
+        width = (area.width() - 2 * area.frameWidth() - area.verticalScrollBar().sizeHint().width()
+                 - 2 * self.image_label.frameWidth())
+        return max(1, min(MAX_RENDER_WIDTH, int(width * self.devicePixelRatioF() * self.zoom_factor)))
+
+    def _cache_key(self, page_num):
+        return (self.doc_serial, page_num, self._target_width(), self.grayscale)
+
+    def _cached_pixmap(self, key):
+        return QtGui.QPixmapCache.find(f"page{key}")
+
+    def _cache_pixmap(self, key, pixmap):
+        QtGui.QPixmapCache.insert(f"page{key}", pixmap)
+        self._cached_keys.add(key)
+
     def render_page(self):
-        page = self.doc.load_page(self.page_num)
-        matrix = fitz.Matrix(self.zoom_factor, self.zoom_factor)
-        pix = page.get_pixmap(matrix=matrix, alpha=False)
+        key = self._cache_key(self.page_num)
+
+        # Stop rendering pages/sizes that are neither shown nor about to be
+        wanted = [key] + self._neighbour_keys()
+        for stale_key in [k for k in self._inflight if k not in wanted]:
+            self._inflight.pop(stale_key).cancelled = True
+
+        pixmap = self._cached_pixmap(key)
+        if pixmap is not None:
+            self._show_pixmap(pixmap, key)
+            self._prefetch_neighbours()
+            return
 
-        img_data = pix.tobytes("png")
-        qimg = QtGui.QImage.fromData(img_data, "PNG")
-        self.original_qimage = qimg.copy()
+        # Rasterize off the GUI thread; bands arrive via _on_band_ready, beginning
+        # with the part in view. If a prefetch for this page is already running,
+        # just wait for it.
+        vbar = self.scroll_area.verticalScrollBar()
+        self._start_render(key, start_fraction=vbar.value() / max(1, vbar.maximum() + vbar.pageStep()))
+
+    def _start_render(self, key, priority=0, start_fraction=0.0):
+        if key in self._inflight:
+            return
+        task = RenderTask(self.doc, key, start_fraction)
+        task.signals.started.connect(self._on_render_started)
+        task.signals.band_ready.connect(self._on_band_ready)
+        task.signals.finished.connect(self._on_render_finished)
+        self._inflight[key] = task
+        self._render_pool.start(task, priority)
+
+    def _neighbour_keys(self):
+        pages = (self.page_num + 1, self.page_num - 1)
+        return [self._cache_key(p) for p in pages if p in self.selected_pages]
+
+    def _prefetch_neighbours(self):
+        # Speculatively render the adjacent pages so sequential navigation hits the cache
+        for key in self._neighbour_keys():
+            if self._cached_pixmap(key) is None:
+                self._start_render(key, priority=-1)
+
+    def _sending_task(self, key):
+        # The task behind a render signal, or None if it was cancelled/superseded
+        task = self._inflight.get(key)
+        if task is None or task.signals is not self.sender():
+            return None
+        return task
+
+    def _task_pixmap(self, task):
+        # Wrap the raw samples directly instead of a PNG encode/decode round-trip
+        fmt = QtGui.QImage.Format_Grayscale8 if task.key[3] else QtGui.QImage.Format_RGB888
+        qimg = QtGui.QImage(task.buffer, task.width, task.height, task.stride, fmt)
+        pixmap = QtGui.QPixmap.fromImage(qimg)
+        pixmap.setDevicePixelRatio(self.devicePixelRatioF())
+        return pixmap
+
+    def _on_render_started(self, key, width, height, stride):
+        task = self._sending_task(key)
+        if task is None:
+            return
+        task.width, task.height, task.stride = width, height, stride
+        task.buffer = bytearray(b"\xff") * (stride * height)
+
+    def _on_band_ready(self, key, top, samples):
+        task = self._sending_task(key)
+        if task is None:
+            return
+
+        # Bands can overlap by a row from rounding; clip them to the page
+        stride = task.stride
+        first = max(0, top)
+        last = min(task.height, top + len(samples) // stride)
+        task.buffer[first * stride:last * stride] = samples[(first - top) * stride:(last - top) * stride]
+        task.rows.append((first, last))
+
+        if key != self._cache_key(self.page_num):
+            return
+        if self._shown_key == key:
+            self._paint_rows(task, [(first, last)])
+        elif self._shown_key is None or self._shown_key[:2] != key[:2]:
+            # A different page: show it as it comes in, on a blank pixmap so the
+            # mostly empty buffer doesn't have to be converted
+            pixmap = QtGui.QPixmap(task.width, task.height)
+            pixmap.fill(QtCore.Qt.white)
+            pixmap.setDevicePixelRatio(self.devicePixelRatioF())
+            self._show_pixmap(pixmap, key)
+            self._paint_rows(task, task.rows)
+        # Otherwise it's the same page at another zoom/width or color mode; keep
+        # the old rendering up until the new one is complete
+
+    def _paint_rows(self, task, rows):
+        # Copy row ranges from the task's buffer onto the displayed pixmap
+        fmt = QtGui.QImage.Format_Grayscale8 if task.key[3] else QtGui.QImage.Format_RGB888
+        qimg = QtGui.QImage(task.buffer, task.width, task.height, task.stride, fmt)
+        ratio = self.bg_pixmap.devicePixelRatio()
+        painter = QtGui.QPainter(self.bg_pixmap)
+        for first, last in rows:
+            source = QtCore.QRectF(0, first, task.width, last - first)
+            painter.drawImage(QtCore.QRectF(0, first / ratio, task.width / ratio, (last - first) / ratio),
+                              qimg, source)
+        painter.end()
+        self.image_label.update()
+
+    def _on_render_finished(self, key):
+        task = self._sending_task(key)
+        if task is None:
+            return
+        del self._inflight[key]
+        if key[0] != self.doc_serial:
+            return  # Rendered from a document that has since been replaced
+
+        # The displayed pixmap already has every band painted in, so reuse it
+        # rather than converting the buffer again
+        if key == self._shown_key:
+            pixmap = self.bg_pixmap
+        else:
+            pixmap = self._task_pixmap(task)
+        self._cache_pixmap(key, pixmap)
+
+        # Prefetched or superseded pages only go into the cache
+        if key == self._cache_key(self.page_num):
+            if key != self._shown_key:
+                self._show_pixmap(pixmap, key)
+            self._prefetch_neighbours()
+
+    def _show_pixmap(self, pixmap, key):
+        self._shown_key = key
+        self.bg_pixmap = pixmap
+        self.image_label.set_page_pixmap(self.bg_pixmap)
         self.update_preview()
 
     def update_preview(self):
-        if self.original_qimage is None:
+        if self.bg_pixmap is None:
             return
 
         t = self.top_cut_spin.value()
         b = self.bottom_cut_spin.value()
 
-        orig_img = self.original_qimage
-        height = orig_img.height()
-        width = orig_img.width()
-
+        height = self.image_label.page_size().height()
         top_px = int((t / 100.0) * height)
         bottom_px = int((b / 100.0) * height)
 
-        # Create a copy for display
-        display_img = QtGui.QImage(orig_img)
-        painter = QtGui.QPainter(display_img)
-        painter.setCompositionMode(QtGui.QPainter.CompositionMode_SourceOver)
-        painter.setPen(QtCore.Qt.NoPen)
-        painter.setBrush(QtGui.QColor("#ffffcc"))
+        self.image_label.set_cuts(top_px, bottom_px)
 
-        if top_px > 0:
-            painter.drawRect(0, 0, width, top_px)
-        if bottom_px > 0:
-            painter.drawRect(0, height - bottom_px, width, bottom_px)
+    def get_cuts(self):
+        return (self.top_cut_spin.value(), self.bottom_cut_spin.value())
 
-        painter.end()
 
-        self.image_label.setPixmap(QtGui.QPixmap.fromImage(display_img))
-        self.image_label.resize(display_img.width(), display_img.height())
+class PagesModel(QtCore.QAbstractListModel):
+    # Rows are produced on demand, so a 10k-page range costs nothing until painted
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.pages = []
+
+    def set_pages(self, pages):
+        self.beginResetModel()
+        self.pages = pages
+        self.endResetModel()
 
-    def get_cuts(self):
-        return (self.top_cut_spin.value(), self.bottom_cut_spin.value())
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.pages)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if role == QtCore.Qt.DisplayRole and index.isValid():
+            return f"Page {self.pages[index.row()] + 1}"
+        return None
 
 
 class PDFTrimApp(QtWidgets.QWidget):
@@ -119,9 +465,12 @@ class PDFTrimApp(QtWidgets.QWidget):
         self.setWindowTitle("PDF Trimmer")
 
         self.pdf_path = None
+        self.pdf_mtime = None  # Modification time of pdf_path when it was opened
         self.doc = None
+        self.doc_serial = 0  # Bumped for every opened document
         self.selected_pages = []
-        self.page_trim = {}  # page_num: (top_cut, bottom_cut)
+        # page_num: (top_cut, bottom_cut); only pages that were visited are stored
+        self.page_trim = {}
         self.current_page = None
 
         main_layout = QtWidgets.QVBoxLayout(self)
@@ -149,8 +498,11 @@ class PDFTrimApp(QtWidgets.QWidget):
         range_layout.addWidget(self.end_page_edit)
 
         splitter = QtWidgets.QSplitter()
-        self.pages_list = QtWidgets.QListWidget()
-        self.pages_list.itemSelectionChanged.connect(self.page_selected)
+        self.pages_model = PagesModel(self)
+        self.pages_list = QtWidgets.QListView()
+        self.pages_list.setUniformItemSizes(True)
+        self.pages_list.setModel(self.pages_model)
+        self.pages_list.selectionModel().selectionChanged.connect(self.page_selected)
         self.preview_widget = PagePreviewWidget()
 
         splitter.addWidget(self.pages_list)
@@ -172,18 +524,37 @@ class PDFTrimApp(QtWidgets.QWidget):
 
     def load_pdf_and_pages(self):
         path = self.pdf_path_edit.text().strip()
-        # Handle file:/// prefix
-        if path.startswith("file:///"):
-            path = path[8:]  # Remove 'file:///'
-            path = unquote(path)  # Decode URL-encoded characters
+        # Handle file:// URLs, including file://host/... and file:///C:/... forms
+        url = urlparse(path)
+        if url.scheme == "file":
+            if url.netloc and url.netloc != "localhost":
+                path = url2pathname(f"//{url.netloc}{url.path}")
+            else:
+                path = url2pathname(url.path)  # Also decodes URL-encoded characters
 
         if not path or not os.path.exists(path):
             QtWidgets.QMessageBox.warning(self, "Error", "File does not exist.")
             return
 
+        # Reloading the unchanged file that's already open only re-applies the
+        # page range, keeping the open document and its rendered pages
+        mtime = os.path.getmtime(path)
+        if self.doc is not None and path == self.pdf_path and mtime == self.pdf_mtime:
+            self.load_pages_range()
+            return
+
+        if self.doc is not None:
+            self.preview_widget.unload()  # Cancels its render tasks
+            with QtCore.QMutexLocker(MUPDF_LOCK):
+                self.doc.close()
+            self.doc = None
+
         try:
-            self.doc = fitz.open(path)
+            with QtCore.QMutexLocker(MUPDF_LOCK):
+                self.doc = fitz.open(path)
+            self.doc_serial += 1
             self.pdf_path = path
+            self.pdf_mtime = mtime
             self.load_pages_range()
         except Exception as e:
             QtWidgets.QMessageBox.warning(self, "Error", f"Failed to open PDF: {e}")
@@ -194,7 +565,8 @@ class PDFTrimApp(QtWidgets.QWidget):
             QtWidgets.QMessageBox.warning(self, "Error", "No PDF loaded.")
             return
 
-        total_pages = len(self.doc)
+        with QtCore.QMutexLocker(MUPDF_LOCK):
+            total_pages = len(self.doc)
         start = self.start_page_edit.value() - 1
         end = self.end_page_edit.value() - 1
         if start < 0 or end < 0 or start > end or end >= total_pages:
@@ -203,24 +575,22 @@ class PDFTrimApp(QtWidgets.QWidget):
 
         # Clear previous trims
         self.page_trim.clear()
-        self.selected_pages = list(range(start, end + 1))
-        for p in self.selected_pages:
-            self.page_trim[p] = (0, 0)
+        # Kept as a range: no per-page list, and membership tests are O(1)
+        self.selected_pages = range(start, end + 1)
 
         self.current_page = None
+        self.preview_widget.selected_pages = self.selected_pages
         self.refresh_pages_list()
 
     def refresh_pages_list(self):
-        self.pages_list.clear()
-        for p in self.selected_pages:
-            self.pages_list.addItem(f"Page {p+1}")
+        self.pages_model.set_pages(self.selected_pages)
 
         if not self.selected_pages:
             self.preview_widget.image_label.setText("No page selected")
 
     def page_selected(self):
-        items = self.pages_list.selectedItems()
-        if not items or self.doc is None:
+        rows = self.pages_list.selectionModel().selectedRows()
+        if not rows or self.doc is None:
             return
 
         # Before switching to new page, save current page's cuts
@@ -228,10 +598,9 @@ class PDFTrimApp(QtWidgets.QWidget):
             cur_t, cur_b = self.preview_widget.get_cuts()
             self.page_trim[self.current_page] = (cur_t, cur_b)
 
-        item_text = items[0].text()  # "Page X"
-        page_num = int(item_text.split()[1]) - 1
+        page_num = self.pages_model.pages[rows[0].row()]
         top_cut, bottom_cut = self.page_trim.get(page_num, (0, 0))
-        self.preview_widget.load_page(self.doc, page_num, top_cut, bottom_cut)
+        self.preview_widget.load_page(self.doc, self.doc_serial, page_num, top_cut, bottom_cut)
         self.current_page = page_num
 
     def export_pdf(self):
@@ -244,37 +613,36 @@ class PDFTrimApp(QtWidgets.QWidget):
             self.page_trim[self.current_page] = (t, b)
 
         try:
-            with Pdf.open(self.pdf_path) as pdf:
-                new_pdf = Pdf.new()
-                for p in self.selected_pages:
-                    page = pdf.pages[p]
-                    mediabox = page.mediabox
-                    # Convert Decimal to float
-                    x0, y0, x1, y1 = map(float, mediabox)
-
-                    width = x1 - x0
+            # Copy the selected pages straight from the already open document and
+            # only set their CropBox, instead of rewriting the file with pikepdf.
+            # The document is shared with render threads, hence the lock.
+            with QtCore.QMutexLocker(MUPDF_LOCK):
+                new_pdf = fitz.open()
+                new_pdf.insert_pdf(self.doc, from_page=self.selected_pages[0], to_page=self.selected_pages[-1])
+                # Patch /CropBox on the page objects directly: no Page object per
+                # page, and page_xref lookups get slow once pages are modified
+                xrefs = [new_pdf.page_xref(i) for i in range(len(self.selected_pages))]
+                for xref, p in zip(xrefs, self.selected_pages):
+                    x0, y0, x1, y1 = page_mediabox(new_pdf, xref)
                     height = y1 - y0
-                    t, b = self.page_trim[p]
-                    t = float(t)
-                    b = float(b)
-
-                    top_cut_abs = (t/100.0)*height
-                    bottom_cut_abs = (b/100.0)*height
-                    new_y0 = y0 + bottom_cut_abs
-                    new_y1 = y1 - top_cut_abs
+                    t, b = self.page_trim.get(p, (0.0, 0.0))  # Spinbox values, already floats
+
+                    new_y0 = y0 + (b/100.0)*height
+                    new_y1 = y1 - (t/100.0)*height
                     if new_y1 <= new_y0:
                         new_y1 = new_y0 + 1
 
-                    page.CropBox = [x0, new_y0, x1, new_y1]
-                    new_pdf.pages.append(page)
+                    new_pdf.xref_set_key(xref, "CropBox", f"[{x0:.4f} {new_y0:.4f} {x1:.4f} {new_y1:.4f}]")
 
-                # Save to a temporary file
+                # Save to a temporary file; garbage > 1 is avoided on purpose, higher
+                # levels have been known to mis-handle cached objects
                 temp_dir = tempfile.gettempdir()
                 temp_pdf_path = os.path.join(temp_dir, "trimmed_output.pdf")
-                new_pdf.save(temp_pdf_path)
+                new_pdf.save(temp_pdf_path, garbage=1, deflate=True)
+                new_pdf.close()
 
-                self.copy_file_to_clipboard(temp_pdf_path)
-                QtWidgets.QMessageBox.information(self, "Success", "New PDF copied to clipboard!")
+            self.copy_file_to_clipboard(temp_pdf_path)
+            QtWidgets.QMessageBox.information(self, "Success", "New PDF copied to clipboard!")
 
         except Exception as e:
             QtWidgets.QMessageBox.warning(self, "Error", f"Failed to export PDF: {e}")
@@ -283,10 +651,17 @@ class PDFTrimApp(QtWidgets.QWidget):
         mime_data = QtCore.QMimeData()
         url = QtCore.QUrl.fromLocalFile(file_path)
         mime_data.setUrls([url])
+        # Small files also go on the clipboard as data, so paste targets that
+        # accept PDF content don't have to read the file from disk again
+        if os.path.getsize(file_path) <= 10 * 1024 * 1024:
+            with open(file_path, "rb") as f:
+                mime_data.setData("application/pdf", QtCore.QByteArray(f.read()))
         QtWidgets.QApplication.clipboard().setMimeData(mime_data)
 
 def main():
+    fitz.TOOLS.mupdf_display_errors(False)
     app = QtWidgets.QApplication(sys.argv)
+    QtGui.QPixmapCache.setCacheLimit(256 * 1024)  # In KB; holds the rendered pages
     window = PDFTrimApp()
     window.resize(1200, 800)
     window.show()